@@ -21,7 +21,19 @@ def test(session):
     """Run all the test using the environment variable of the running machine."""
     session.install(".[test]")
     test_files = session.posargs or ["tests"]
-    session.run("pytest", "--color=yes", "--cov", "--cov-report=xml", *test_files)
+    # loadscope keeps the tests of a module on the same worker so the session
+    # scoped fixtures (gee_dir, _test_model, ...) are built once per worker
+    session.run(
+        "pytest",
+        "--color=yes",
+        "--cov",
+        "--cov-report=xml",
+        "-n",
+        "auto",
+        "--dist",
+        "loadscope",
+        *test_files,
+    )
 
 
 @nox.session(name="dead-fixtures", reuse_venv=True)
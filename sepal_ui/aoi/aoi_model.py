@@ -1,6 +1,7 @@
 """Model object dedicated to AOI selection."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -23,6 +24,42 @@ from sepal_ui.scripts import utils as su
 __all__ = ["AoiModel"]
 
 
+@lru_cache(maxsize=None)
+def _get_gaul_items(admin: str) -> Tuple[ee.FeatureCollection, gpd.GeoDataFrame]:
+    """Get the featurecollection and its local representation for a GAUL admin code.
+
+    The results are cached so that building several models on the same admin
+    area only pays the GEE round trip once per session.
+
+    Args:
+        admin: the admin code in the FAO GAUL norm
+
+    Returns:
+        the administrative featurecollection and the corresponding GeoDataFrame
+    """
+    feature_collection = pygaul.AdmItems(admin=admin)
+    features = feature_collection.getInfo()["features"]
+    gdf = gpd.GeoDataFrame.from_features(features).set_crs(epsg=4326)
+
+    return feature_collection, gdf
+
+
+@lru_cache(maxsize=None)
+def _get_gadm_items(admin: str) -> gpd.GeoDataFrame:
+    """Get the GeoDataFrame associated with a GADM admin code.
+
+    The results are cached so that building several models on the same admin
+    area only pays the GADM lookup once per session.
+
+    Args:
+        admin: the admin code in the GADM norm
+
+    Returns:
+        the administrative GeoDataFrame
+    """
+    return pygadm.AdmItems(admin=admin)
+
+
 class AoiModel(Model):
 
     # ###########################################################################
@@ -384,15 +421,14 @@ class AoiModel(Model):
         # get the data from either the pygaul or the pygadm libs
         # pygaul needs extra work as ISO codes are not included in the GEE dataset
         if self.gee:
-            self.feature_collection = pygaul.AdmItems(admin=admin)
-            features = self.feature_collection.getInfo()["features"]
-            self.gdf = gpd.GeoDataFrame.from_features(features).set_crs(epsg=4326)
+            self.feature_collection, gdf = _get_gaul_items(admin)
+            self.gdf = gdf.copy()
             gaul_country = str(self.gdf.ADM0_CODE.unique()[0])
             iso = json.loads(self.MAPPING.read_text())[gaul_country]
             self.gdf["ISO"] = iso
 
         else:
-            self.gdf = pygadm.AdmItems(admin=admin)
+            self.gdf = _get_gadm_items(admin).copy()
 
         # generate the name from the columns
         r = self.gdf.iloc[0]
@@ -1,14 +1,17 @@
 """``Card`` object dedicated to AOI selection. It does not include maps."""
 
 from datetime import datetime as dt
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import ipyvuetify as v
+import pandas as pd
 import pygadm
 import pygaul
 import traitlets as t
 from deprecated.sphinx import versionadded
+from ipyleaflet import GeoJSON
 from typing_extensions import Self
 
 import sepal_ui.sepalwidgets as sw
@@ -26,6 +29,56 @@ select_methods = AoiModel.METHODS
 __all__ = ["AoiView", "select_methods"]
 
 
+@lru_cache(maxsize=None)
+def _get_admin_df(gee: bool, admin: str, content_level: int) -> pd.DataFrame:
+    """Get the sorted administrative names of the requested level.
+
+    The results are cached at module level so that the GAUL/GADM tables are only
+    parsed once per (gee, admin, content_level) combination, no matter how many
+    AdminField are created or updated.
+
+    Args:
+        gee: whether to use the GAUL (True) or GADM (False) dataset
+        admin: the administrative code of the parent level
+        content_level: the level of the administrative names to get
+
+    Returns:
+        the sorted administrative names
+    """
+    AdmNames = pygaul.AdmNames if gee else pygadm.AdmNames
+    df = AdmNames(admin=admin, content_level=content_level)
+
+    return df.sort_values(by=[df.columns[0]])
+
+
+@lru_cache(maxsize=None)
+def _get_admin_items(gee: bool, admin: str, content_level: int) -> Tuple[dict, ...]:
+    """Build the item list of an admin select for the requested level.
+
+    The fully normalized items are cached at module level so that selecting a
+    parent code that was already requested costs a single lookup instead of a
+    dataframe scan and a name normalization pass.
+
+    Args:
+        gee: whether to use the GAUL (True) or GADM (False) dataset
+        admin: the administrative code of the parent level
+        content_level: the level of the administrative names to get
+
+    Returns:
+        the items formatted for a select component
+    """
+    df = _get_admin_df(gee, admin, content_level)
+
+    # first column will be the name, second the code
+    names = df.iloc[:, 0].tolist()
+    values = df.iloc[:, 1].astype(str).tolist()
+
+    return tuple(
+        {"text": su.normalize_str(n, folder=False), "value": v}
+        for n, v in zip(names, values)
+    )
+
+
 class MethodSelect(sw.Select):
     def __init__(
         self,
@@ -46,48 +99,45 @@ class MethodSelect(sw.Select):
             map_: link the aoi_view to a custom SepalMap to display the output, default to None
             gee: whether to bind to ee or not
         """
-        # create the method list
+        # get the list of methods to display
         if methods == "ALL":
-            self.methods = select_methods
+            kept = list(select_methods)
         elif methods == "ADMIN":
-            self.methods = {
-                k: v for k, v in select_methods.items() if v["type"] == ADMIN
-            }
+            kept = [k for k, m in select_methods.items() if m["type"] == ADMIN]
         elif methods == "CUSTOM":
-            self.methods = {
-                k: v for k, v in select_methods.items() if v["type"] == CUSTOM
-            }
-        elif type(methods) == list:
-            if any(m[0] == "-" for m in methods) != all(m[0] == "-" for m in methods):
+            kept = [k for k, m in select_methods.items() if m["type"] == CUSTOM]
+        elif isinstance(methods, (list, tuple)):
+            neg = [m[0] == "-" for m in methods]
+            if any(neg) != all(neg):
                 raise Exception("You mixed adding and removing, punk")
 
-            if methods[0][0] == "-":
-                to_remove = [method[1:] for method in methods]
-
-                # Rewrite the methods instead of mutate the class methods
-                self.methods = {
-                    k: v for k, v in select_methods.items() if k not in to_remove
-                }
+            if neg[0]:
+                to_remove = {method[1:] for method in methods}
+                kept = [k for k in select_methods if k not in to_remove]
 
             else:
-                self.methods = {k: select_methods[k] for k in methods}
+                kept = list(methods)
         else:
             raise Exception("I don't get what you meant")
 
         # clean the list from things we can't use
-        gee is True or self.methods.pop("ASSET", None)
-        map_ is not None or self.methods.pop("DRAW", None)
+        gee is True or "ASSET" not in kept or kept.remove("ASSET")
+        map_ is not None or "DRAW" not in kept or kept.remove("DRAW")
 
-        # build the item list with header
+        # build the method dict and the item list (with headers) in a single pass
+        # instead of mutating the class methods
+        self.methods = {}
         prev_type = None
         items = []
-        for k, m in self.methods.items():
+        for k in kept:
+            m = select_methods[k]
             current_type = m["type"]
 
             if prev_type != current_type:
                 items.append({"header": current_type})
             prev_type = current_type
 
+            self.methods[k] = m
             items.append({"text": m["name"], "value": k})
 
         # create the input
@@ -104,6 +154,9 @@ class AdminField(sw.Select):
     parent: Optional[sw.Select] = None
     "The parent adminfield object"
 
+    _last_filter: Optional[str] = None
+    "The last parent code used to build the item list"
+
     def __init__(
         self, level: int, parent: Optional[sw.Select] = None, gee: bool = True
     ) -> None:
@@ -144,22 +197,17 @@ class AdminField(sw.Select):
         Args:
             filter\_: The code of the parent v_model to filter the current results
         """
-        AdmNames = pygaul.AdmNames if self.gee else pygadm.AdmNames
-        df = AdmNames(admin=filter_, content_level=self.level)
-        df = df.sort_values(by=[df.columns[0]])
-
-        # formatted as a item list for a select component
-        # first column will be the name, second the code
-        items = []
-        for _, r in df.iterrows():
-            text = su.normalize_str(r.iloc[0], folder=False)
-            items.append({"text": text, "value": str(r.iloc[1])})
-        self.items = items
+        self.items = list(_get_admin_items(self.gee, filter_, self.level))
 
         return self
 
     def _update(self, change: dict) -> Self:
         """Update the item list of the admin select."""
+        # skip the rebuild on spurious fires with an unchanged parent code
+        if change["new"] == self._last_filter:
+            return self
+        self._last_filter = change["new"]
+
         # reset v_model
         self.v_model = None
 
@@ -197,6 +245,9 @@ class AoiView(sw.Card):
     map_: Optional[sm.SepalMap] = None
     "The map to draw the AOI"
 
+    aoi_layer: Optional[GeoJSON] = None
+    "The currently displayed aoi layer, kept as a reference for O(1) removal"
+
     aoi_dc: Optional[sm.DrawControl] = None
     "the drawing control associated with DRAW method"
 
@@ -359,9 +410,13 @@ class AoiView(sw.Card):
 
         # update the map
         if self.map_:
-            self.map_.remove_layer("aoi", none_ok=True)
+            # remove the previous layer by reference instead of scanning
+            # the layer list by name
+            key = self.aoi_layer if self.aoi_layer is not None else "aoi"
+            self.map_.remove_layer(key, none_ok=True)
             self.map_.zoom_bounds(self.model.total_bounds())
-            self.map_.add_layer(self.model.get_ipygeojson(self.map_style))
+            self.aoi_layer = self.model.get_ipygeojson(self.map_style)
+            self.map_.add_layer(self.aoi_layer)
 
             self.aoi_dc.hide()
 
@@ -377,7 +432,9 @@ class AoiView(sw.Card):
 
         # clear the map
         if self.map_ is not None:
-            self.map_.remove_layer("aoi", none_ok=True)
+            key = self.aoi_layer if self.aoi_layer is not None else "aoi"
+            self.map_.remove_layer(key, none_ok=True)
+            self.aoi_layer = None
 
         return self
 
@@ -387,11 +444,14 @@ class AoiView(sw.Card):
         # clear and hide the alert
         self.alert.reset()
 
-        # hide the widget so that the user doesn't see status changes
-        [w.hide() for w in self.components.values()]
+        # hide the widgets so that the user doesn't see status changes
+        # only toggle the ones that are visible to save frontend messages
+        for w in self.components.values():
+            w.viz is False or w.hide()
 
         # clear the inputs in a second step as resetting a FileInput can be long
-        [w.reset() for w in self.components.values()]
+        for w in self.components.values():
+            w.reset()
 
         # deactivate or activate the dc
         # clear the geo_json saved features to start from scratch
@@ -402,8 +462,12 @@ class AoiView(sw.Card):
                 self.aoi_dc.hide()
 
             # init the name to the current value
-            now = dt.now().strftime("%Y-%m-%d_%H-%M-%S")
-            self.w_draw.v_model = None if change["new"] is None else f"Manual_aoi_{now}"
+            # only pay for the timestamp when a name is actually needed
+            if change["new"] is None:
+                self.w_draw.v_model = None
+            else:
+                now = dt.now().strftime("%Y-%m-%d_%H-%M-%S")
+                self.w_draw.v_model = f"Manual_aoi_{now}"
 
         # activate the correct widget
         w = next((w for k, w in self.components.items() if k == change["new"]), None)
@@ -108,11 +108,12 @@ class SepalColor(HasTraits, SimpleNamespace):
         # Get get current theme name
         self.theme_name = "dark" if self._dark_theme else "light"
 
-        # Save "new" theme in configuration file
-        su.set_config("theme", self.theme_name)
+        # Save "new" theme in configuration file only when it changed
+        get_theme() == self.theme_name or su.set_config("theme", self.theme_name)
 
-        self.kwargs = DARK_THEME if self._dark_theme else LIGHT_THEME
-        self.kwargs = new_colors or self.kwargs
+        # merge the user overrides on top of the base theme so that
+        # unspecified colors keep their default value
+        self.kwargs = {**(DARK_THEME if self._dark_theme else LIGHT_THEME), **new_colors}
 
         # Even if the theme.themes.dark_theme trait could trigger the change on all elms
         # we have to replace the default values every time:
@@ -120,7 +121,11 @@ class SepalColor(HasTraits, SimpleNamespace):
 
         # TODO: Would be awesome to find a way to create traits for the new colors and
         # assign them here directly
-        [setattr(theme, color_name, color) for color_name, color in self.kwargs.items()]
+        # only rewrite the colors that actually changed to keep the number of
+        # fired traitlets to a minimum
+        for color_name, color in self.kwargs.items():
+            if getattr(theme, color_name, None) != color:
+                setattr(theme, color_name, color)
 
         # Now instantiate the namespace
         SimpleNamespace.__init__(self, **self.kwargs)
@@ -3,12 +3,18 @@
 from copy import deepcopy
 from typing import Optional
 
-import geopandas as gpd
 import ipyleaflet as ipl
+from pyproj import Transformer
 from shapely import geometry as sg
+from shapely import ops
 
 from sepal_ui import color
 
+# cached transformer pipelines used to polygonize circles
+# building them is expensive so they are shared by all the controls
+_to_mercator = Transformer.from_crs(4326, 3857, always_xy=True).transform
+_to_latlong = Transformer.from_crs(3857, 4326, always_xy=True).transform
+
 
 class DrawControl(ipl.DrawControl):
 
@@ -81,13 +87,15 @@ class DrawControl(ipl.DrawControl):
 
         # create shapely point
         center = sg.Point(geo_json["geometry"]["coordinates"])
-        point = gpd.GeoSeries([center], crs=4326)
 
+        # buffer the point in webmercator and come back to latlong
+        # using the cached transformers instead of a GeoSeries round-trip
         radius = geo_json["properties"]["style"]["radius"]
-        circle = point.to_crs(3857).buffer(radius).to_crs(4326)
+        circle = ops.transform(_to_mercator, center).buffer(radius)
+        circle = ops.transform(_to_latlong, circle)
 
         # insert it in the geo_json
         output = geo_json.copy()
-        output["geometry"] = circle[0].__geo_interface__
+        output["geometry"] = circle.__geo_interface__
 
         return output
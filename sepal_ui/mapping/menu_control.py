@@ -1,6 +1,6 @@
 """Base menu ``Control`` to display widgets to your user."""
 
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 import ipyvuetify as v
 from ipyleaflet import Map, WidgetControl
@@ -11,6 +11,14 @@ from sepal_ui import color
 from sepal_ui import sepalwidgets as sw
 from sepal_ui.mapping.map_btn import MapBtn
 
+MENU_POSITION: Dict[str, Tuple[bool, bool, bool, bool]] = {
+    "topleft": (False, True, False, True),
+    "topright": (False, True, True, False),
+    "bottomleft": (True, False, False, True),
+    "bottomright": (True, False, True, False),
+}
+"The (top, bottom, left, right) menu values associated with each control position"
+
 
 class MenuControl(WidgetControl):
 
@@ -109,10 +117,10 @@ class MenuControl(WidgetControl):
 
     def update_position(self, *args) -> None:
         """Update the position of the menu if the position of the widget is dynamically changed."""
-        self.menu.top = "bottom" in self.position
-        self.menu.bottom = "top" in self.position
-        self.menu.left = "right" in self.position
-        self.menu.right = "left" in self.position
+        # batch the 4 trait writes in a single frontend message
+        with self.menu.hold_sync():
+            menu = self.menu
+            menu.top, menu.bottom, menu.left, menu.right = MENU_POSITION[self.position]
 
         return
 
@@ -16,8 +16,6 @@ from pathlib import Path
 from typing import Any, Callable, List, Optional
 from warnings import warn
 
-import ee
-import httplib2
 import ipyvuetify as v
 from deprecated.sphinx import versionadded
 
@@ -39,6 +37,10 @@ def init_ee() -> None:
     It will use the creddential file if the EARTHENGINE_TOKEN env variable exist.
     Otherwise it use the simple Initialize command (asking the user to register if necessary).
     """
+    # deferred so that non-gee applications never pay the earthengine import
+    import ee
+    import httplib2
+
     # only do the initialization if the credential are missing
     if not ee.data._credentials:
         # if the credentials token is asved in the environment use it
@@ -1,18 +1,19 @@
 """All the helper function of sepal-ui."""
 
 import configparser
-import math
 import os
 import random
 import re
 import string
 import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Sequence, Tuple, Union
 from urllib.parse import urlparse
 
-import ee
-import httplib2
+if TYPE_CHECKING:
+    import ee
+
 import ipyvuetify as v
 import requests
 import tomli
@@ -29,6 +30,9 @@ from sepal_ui.scripts.warning import SepalWarning
 # Types
 Pathlike = Union[str, Path]
 
+SIZE_NAMES = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+"The file size units in increasing 1024-power order"
+
 
 def hide_component(widget: v.VuetifyWidget) -> v.VuetifyWidget:
     """Hide a vuetify based component.
@@ -42,8 +46,8 @@ def hide_component(widget: v.VuetifyWidget) -> v.VuetifyWidget:
     if isinstance(widget, sepal_ui.sepalwidgets.sepalwidget.SepalWidget):
         widget.hide()
 
-    elif "d-none" not in str(widget.class_):
-        widget.class_ = str(widget.class_).strip() + " d-none"
+    elif "d-none" not in (klass := str(widget.class_)):
+        widget.class_ = klass.strip() + " d-none"
 
     return widget
 
@@ -60,8 +64,8 @@ def show_component(widget: v.VuetifyWidget) -> v.VuetifyWidget:
     if isinstance(widget, sepal_ui.sepalwidgets.sepalwidget.SepalWidget):
         widget.show()
 
-    elif "d-none" in str(widget.class_):
-        widget.class_ = widget.class_.replace("d-none", "")
+    elif "d-none" in (klass := str(widget.class_)):
+        widget.class_ = klass.replace("d-none", "")
 
     return widget
 
@@ -76,7 +80,11 @@ def create_download_link(pathname: Pathlike) -> str:
         the download link
     """
     # return the link if it's an absolute url
-    if isinstance(pathname, str) and bool(urlparse(str(pathname)).netloc):
+    # the startswith check short-circuits the full urlparse for common schemes
+    if isinstance(pathname, str) and (
+        pathname.startswith(("http://", "https://", "ftp://", "//"))
+        or bool(urlparse(pathname).netloc)
+    ):
         return pathname
 
     # create a downloadable link from the jupyter node
@@ -103,9 +111,7 @@ def random_string(string_length: int = 3) -> str:
     Returns:
         A random string
     """
-    letters = string.ascii_lowercase
-
-    return "".join(random.choice(letters) for i in range(string_length))
+    return "".join(random.choices(string.ascii_lowercase, k=string_length))
 
 
 def get_file_size(filename: Pathlike) -> str:
@@ -119,11 +125,18 @@ def get_file_size(filename: Pathlike) -> str:
     """
     file_size = Path(filename).stat().st_size
 
-    size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-    i = int(math.floor(math.log(file_size, 1024))) if file_size > 0 else 0
-    s = file_size / (1024**i)
+    # the scale is the position of the most significant 10-bit group,
+    # computed with integer ops instead of a floating point logarithm
+    # st_size is coerced as some filesystems (and mocks) report it as a float
+    bits = int(file_size).bit_length()
+    i = min((bits - 1) // 10, len(SIZE_NAMES) - 1) if file_size else 0
+    s = file_size / (1 << (10 * i))
 
-    return "{:.1f} {}".format(s, size_name[i])
+    return "{:.1f} {}".format(s, SIZE_NAMES[i])
+
+
+_ee_initialized = False
+"Whether earthengine was already initialized in this process"
 
 
 def init_ee() -> None:
@@ -132,6 +145,16 @@ def init_ee() -> None:
     It will use the creddential file if the EARTHENGINE_TOKEN env variable exist.
     Otherwise it use the simple Initialize command (asking the user to register if necessary).
     """
+    # deferred so that non-gee applications never pay the earthengine import
+    import ee
+    import httplib2
+
+    global _ee_initialized
+
+    # skip the credential lookup as soon as one initialization succeeded
+    if _ee_initialized:
+        return
+
     # only do the initialization if the credential are missing
     if not ee.data._credentials:
         # if the credentials token is asved in the environment use it
@@ -148,12 +171,18 @@ def init_ee() -> None:
         ee.Initialize(http_transport=httplib2.Http())
         assert len(ee.data.getAssetRoots()) > 0, ms.utils.ee.no_asset_root
 
+    _ee_initialized = True
+
     return
 
 
+@lru_cache(maxsize=None)
 def normalize_str(msg: str, folder: bool = True) -> str:
     """Normalize an str to make it compatible with file naming (no spaces, special chars ...etc).
 
+    The function is pure so results are memoized: renormalizing the same name
+    (e.g. admin names on every parent selection) is a cache lookup.
+
     Params:
         msg: the string to sanitise
         folder: if the name will be used for folder naming or for display. if display, <'> and < > characters will be kept
@@ -306,7 +335,7 @@ def set_type(color: str) -> str:
 @versionadded(version="2.8.0")
 def geojson_to_ee(
     geo_json: dict, geodesic: bool = False, encoding: str = "utf-8"
-) -> ee.FeatureCollection:
+) -> "ee.FeatureCollection":
     """Transform a geojson object into a featureCollection or a Geometry.
 
     No sanity check is performed on the initial geo_json. It must respect the
@@ -320,6 +349,9 @@ def geojson_to_ee(
     Returns:
         the created featurecollection
     """
+    # deferred so that non-gee applications never pay the earthengine import
+    import ee
+
     # from a featureCollection
     if geo_json["type"] == "FeatureCollection":
         for feature in geo_json["features"]:
@@ -72,6 +72,9 @@ class Alert(v.Alert, SepalWidget):
     progress_output: Optional[Output] = None
     "the output object where the progress bar is stored"
 
+    _live_children: Optional[list] = None
+    "the timestamp and message lines reused across add_live_msg calls"
+
     def __init__(self, type_: str = "info", **kwargs) -> None:
         r"""A custom Alert widget.
 
@@ -177,10 +180,18 @@ class Alert(v.Alert, SepalWidget):
 
         self.show()
         self.type = set_type(type_)
-        self.children = [
-            v.Html(tag="p", children=["[{}]".format(current_time)]),
-            v.Html(tag="p", children=[msg]),
-        ]
+
+        # reuse the same 2 html lines so that live loops (e.g. log following)
+        # update the existing widgets instead of allocating 2 per message
+        if self._live_children is None:
+            self._live_children = [v.Html(tag="p"), v.Html(tag="p")]
+
+        ts_html, msg_html = self._live_children
+        ts_html.children = ["[{}]".format(current_time)]
+        msg_html.children = [msg]
+
+        if list(self.children) != self._live_children:
+            self.children = self._live_children[:]
 
         return self
 
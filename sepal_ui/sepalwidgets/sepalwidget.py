@@ -12,6 +12,7 @@ Example:
 """
 
 import warnings
+from collections import deque
 from typing import List, Optional, Type, Union
 
 import ipyvuetify as v
@@ -61,17 +62,19 @@ class SepalWidget(v.VuetifyWidget):
         # will be replaced byt direct calls to built-in hide
         # once the previous custom implementation will be fully removed
 
+        # compute the final class string and assign it once: every class_
+        # write is synced to the frontend so intermediate states are wasted
         if self.viz:
 
-            # change class value
-            self.class_ = self.old_class or self.class_
-            self.class_list.remove("d-none")
+            # restore the previous class value
+            klass = str(self.old_class or self.class_ or "")
+            self.class_ = " ".join(c for c in klass.split() if c != "d-none")
 
         else:
 
-            # change class value
-            self.class_list.remove("d-none")
-            self.old_class = str(self.class_)
+            # save the current class value
+            klass = str(self.class_ or "")
+            self.old_class = " ".join(c for c in klass.split() if c != "d-none")
             self.class_ = "d-none"
 
         return
@@ -158,19 +161,19 @@ class SepalWidget(v.VuetifyWidget):
         # init the widget
         widget = self if widget is None else widget
 
-        for w in widget.children:
+        # walk the children tree iteratively, depth-first to keep the
+        # historical output order without paying the recursion overhead
+        queue = deque(widget.children)
+        while queue:
+            w = queue.popleft()
 
-            # exit if children is not a widget (str, DOM objects.. etc)
+            # skip if children is not a widget (str, DOM objects.. etc)
             if not isinstance(w, (v.VuetifyWidget, v.Html)):
                 continue
 
             # compare the widget with requirements
             # if no klass is specified, use both vuetifyWidget and Html objects
-            is_klass = (
-                isinstance(w, klass)
-                if klass
-                else isinstance(w, ((v.VuetifyWidget, v.Html)))
-            )
+            is_klass = isinstance(w, klass) if klass else True
 
             # using "niet" as default so that result is True if attr is Falsy
             # "niet" is very unlikely to be used compared to None, False, "none"...
@@ -179,7 +182,7 @@ class SepalWidget(v.VuetifyWidget):
             not (is_klass and is_val) or elements.append(w)
 
             # always search for nested elements
-            elements = self.get_children(w, klass, attr, value, id_, elements)
+            queue.extendleft(reversed(w.children))
 
         return elements
 
@@ -195,21 +198,18 @@ class SepalWidget(v.VuetifyWidget):
         if not isinstance(children, list):
             children = [children]
 
-        new_childrens = self.children[:]
-
+        # build the final list in one pass instead of copying then concatenating
         if position == "first":
-            new_childrens = children + new_childrens
+            self.children = [*children, *self.children]
 
         elif position == "last":
-            new_childrens = new_childrens + children
+            self.children = [*self.children, *children]
 
         else:
             raise ValueError(
                 f"Position '{position}' is not a valid value. Use 'first' or 'last'"
             )
 
-        self.children = new_childrens
-
         return self
 
     @versionadded(version="2.9.0", reason="Tooltip are now integrated to widgets")
@@ -11,6 +11,7 @@ Example:
         sw.TileDisclaimer()
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Union
 
@@ -25,6 +26,19 @@ from sepal_ui.sepalwidgets.widget import Markdown
 __all__ = ["Tile", "TileAbout", "TileDisclaimer"]
 
 
+@lru_cache(maxsize=None)
+def _read_md_file(pathname: str) -> str:
+    """Read the content of a .md file, cached as the about files are static.
+
+    Args:
+        pathname: the path to the .md file
+
+    Returns:
+        the file content
+    """
+    return Path(pathname).read_text()
+
+
 class Tile(v.Layout, SepalWidget):
 
     btn: Optional[v.Btn] = None
@@ -190,7 +204,7 @@ class TileAbout(Tile):
         Args:
             pathname: the path to the .md file
         """
-        content = Markdown(Path(pathname).read_text())
+        content = Markdown(_read_md_file(str(pathname)))
         super().__init__("about_tile", "About", inputs=[content])
 
 
@@ -14,9 +14,9 @@ from pathlib import Path
 from typing import Optional
 
 import ipyvuetify as v
+import markdown as md
 import traitlets as t
 from deprecated.sphinx import versionadded
-from markdown import markdown
 from traitlets import link, observe
 
 from sepal_ui import color
@@ -25,6 +25,15 @@ from sepal_ui.sepalwidgets.sepalwidget import SepalWidget, Tooltip
 
 __all__ = ["Markdown", "CopyToClip", "StateIcon"]
 
+_md_converter = md.Markdown(extensions=["fenced_code", "sane_lists"])
+"A single reusable converter as registering the extensions dominates the conversion cost"
+
+
+class _MarkdownTemplate(v.VuetifyTemplate):
+
+    template = t.Unicode("").tag(sync=True)
+    "the html converted from the markdown content"
+
 
 class Markdown(v.Layout, SepalWidget):
     def __init__(self, mkd_str: str = "", **kwargs) -> None:
@@ -34,7 +43,7 @@ class Markdown(v.Layout, SepalWidget):
             mkd_str: the text to display using the markdown convention. multi-line string are also interpreted
             kwargs: Any parameter from a v.Layout. If set, 'children' will be overwritten
         """
-        mkd = markdown(mkd_str, extensions=["fenced_code", "sane_lists"])
+        mkd = _md_converter.reset().convert(mkd_str)
 
         # need to be nested in a div to be displayed
         mkd = "<div>\n" + mkd + "\n</div>"
@@ -43,10 +52,7 @@ class Markdown(v.Layout, SepalWidget):
         mkd = mkd.replace("<a", '<a target="_blank"')
 
         # create a Html widget
-        class MyHTML(v.VuetifyTemplate):
-            template = t.Unicode(mkd).tag(sync=True)
-
-        content = MyHTML()
+        content = _MarkdownTemplate(template=mkd)
 
         # set default parameters
         kwargs.setdefault("row", True)
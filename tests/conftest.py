@@ -24,6 +24,13 @@ try:
 except Exception:
     pass  # try to init earthengine. use ee.data._credentials to skip
 
+try:
+    import pyogrio  # noqa: F401
+
+    gpd.options.io_engine = "pyogrio"
+except ImportError:
+    pass  # shapefile reads will fall back to the slower fiona engine
+
 # -- a component to fake the display in Ipython --------------------------------
 
 
@@ -232,9 +239,11 @@ def fake_vector(tmp_path_factory: pytest.TempPathFactory) -> Path:
     Returns:
         the path to the tmp vector file
     """
-    link = "https://geodata.ucdavis.edu/gadm/gadm4.1/json/gadm41_VAT_0.json"
+    # a simplified copy of gadm41_VAT_0.json is bundled in the repository
+    # so that the default test run never hits geodata.ucdavis.edu
+    source = Path(__file__).parent / "data" / "gadm41_VAT_0.geojson"
     file = tmp_path_factory.mktemp("temp") / "gadm41_VAT_0.shp"
-    gpd.read_file(link).to_file(file)
+    gpd.read_file(source).to_file(file)
     return file
 
 
@@ -1,5 +1,6 @@
 """Test AoiModel custom model."""
 
+import copy
 from pathlib import Path
 from typing import List
 
@@ -10,22 +11,29 @@ from traitlets import Dict, Unicode
 from sepal_ui import aoi
 
 
-def test_init_no_ee(fake_vector: Path) -> None:
-    """Init an AoiModel without GEE.
-
-    Args:
-        fake_vector: the path to a fake vector file
-    """
-    # default init
+def test_init_no_ee() -> None:
+    """Init an AoiModel without GEE."""
     aoi_model = aoi.AoiModel(gee=False)
     assert isinstance(aoi_model, aoi.AoiModel)
     assert aoi_model.gee is False
 
-    # with a default vector
+    return
+
+
+def test_init_no_ee_vector(fake_vector: Path) -> None:
+    """Init an AoiModel without GEE on a default vector.
+
+    Args:
+        fake_vector: the path to a fake vector file
+    """
     aoi_model = aoi.AoiModel(vector=fake_vector, gee=False)
     assert aoi_model.name == "gadm41_VAT_0"
 
-    # test with a non ee admin
+    return
+
+
+def test_init_no_ee_admin() -> None:
+    """Init an AoiModel without GEE on a default admin."""
     admin = "VAT"  # GADM Vatican city
     aoi_model = aoi.AoiModel(gee=False, admin=admin)
 
@@ -41,38 +49,65 @@ def test_init_ee(gee_dir: Path) -> None:
     Args:
         gee_dir: the session directory where assets are saved
     """
-    # default init
     aoi_model = aoi.AoiModel(folder=gee_dir)
     assert isinstance(aoi_model, aoi.AoiModel)
     assert aoi_model.gee is True
 
-    # with default assetId
+    return
+
+
+@pytest.mark.skipif(not ee.data._credentials, reason="GEE is not set")
+def test_init_ee_asset(gee_dir: Path) -> None:
+    """Init an AoiModel with GEE on a default assetId.
+
+    Args:
+        gee_dir: the session directory where assets are saved
+    """
     asset_id = str(gee_dir / "feature_collection")
     aoi_model = aoi.AoiModel(asset=asset_id, folder=gee_dir)
 
     assert aoi_model.asset_name == asset_id
     assert aoi_model.default_asset == asset_id
-    assert all(aoi_model.gdf) is not None
+    assert aoi_model.gdf is not None and not aoi_model.gdf.empty
     assert aoi_model.feature_collection is not None
     assert aoi_model.name == "feature_collection"
 
-    # check that wrongly defined asset_name raise errors
-    with pytest.raises(Exception):
-        aoi_model = aoi.AoiModel(folder=gee_dir)
-        aoi_model._from_asset({"pathname": None})
-
-    with pytest.raises(Exception):
-        aoi_model = aoi.AoiModel(folder=gee_dir)
-        asset = {"pathname": asset_id, "column": "data", "value": None}
-        aoi_model._from_asset(asset)
-
     # it should be the same with a different name
     aoi_model = aoi.AoiModel(folder=gee_dir)
     asset = {"pathname": asset_id, "column": "data", "value": 0}
     aoi_model._from_asset(asset)
     assert aoi_model.name == "feature_collection_data_0"
 
-    # with a default admin
+    return
+
+
+@pytest.mark.skipif(not ee.data._credentials, reason="GEE is not set")
+@pytest.mark.parametrize(
+    "asset", [{"pathname": None}, {"column": "data", "value": None}]
+)
+def test_init_ee_wrong_asset(gee_dir: Path, asset: dict) -> None:
+    """Check that wrongly defined asset_name raise errors.
+
+    Args:
+        gee_dir: the session directory where assets are saved
+        asset: an incomplete asset definition
+    """
+    asset = {"pathname": str(gee_dir / "feature_collection"), **asset}
+    aoi_model = aoi.AoiModel(folder=gee_dir)
+
+    with pytest.raises(Exception):
+        aoi_model._from_asset(asset)
+
+    return
+
+
+@pytest.mark.skipif(not ee.data._credentials, reason="GEE is not set")
+def test_init_ee_admin(gee_dir: Path) -> None:
+    """Init an AoiModel with GEE on a default admin.
+
+    Args:
+        gee_dir: the session directory where assets are saved
+    """
     admin = "110"  # GAUL Vatican city
     aoi_model = aoi.AoiModel(admin=admin, folder=gee_dir)
     assert aoi_model.name == "VAT"
@@ -171,8 +206,10 @@ def test_clear_attributes(
     def set_out(out_id: str) -> None:
         return setattr(aoi_model, out_id, "dump")
 
-    [set_trait(trait) for trait in aoi_model_traits]
-    [set_out(out) for out in aoi_model_outputs]
+    for trait in aoi_model_traits:
+        set_trait(trait)
+    for out in aoi_model_outputs:
+        set_out(out)
 
     # clear all the parameters
     aoi_model.clear_attributes()
@@ -181,15 +218,17 @@ def test_clear_attributes(
     def is_none(member: str) -> None:
         return getattr(aoi_model, member) is None
 
-    assert all([is_none(trait) for trait in aoi_model_traits])
-    assert all([is_none(out) for out in aoi_model_outputs])
+    assert all(is_none(trait) for trait in aoi_model_traits)
+    assert all(is_none(out) for out in aoi_model_outputs)
 
     # check that default are saved
     aoi_model = aoi.AoiModel(admin="VAT", gee=False)  # GADM for Vatican
 
     # insert dumpmy parameter
-    [set_trait(trait) for trait in aoi_model_traits]
-    [set_out(out) for out in aoi_model_outputs]
+    for trait in aoi_model_traits:
+        set_trait(trait)
+    for out in aoi_model_outputs:
+        set_out(out)
 
     # clear
     aoi_model.clear_attributes()
@@ -234,11 +273,11 @@ def test_clear_output(test_model: aoi.AoiModel, aoi_model_outputs: List[str]) ->
         return getattr(test_model, member) is None
 
     # test that the data are not all empty
-    assert any([is_not_none(out) for out in aoi_model_outputs])
+    assert any(is_not_none(out) for out in aoi_model_outputs)
 
     # clear the aoi outputs
     test_model.clear_output()
-    assert all([is_none(out) for out in aoi_model_outputs])
+    assert all(is_none(out) for out in aoi_model_outputs)
 
     return
 
@@ -422,8 +461,8 @@ def square() -> dict:
     }
 
 
-@pytest.fixture(scope="function")
-def test_model(gee_dir: Path) -> aoi.AoiModel:
+@pytest.fixture(scope="session")
+def _test_model(gee_dir: Path) -> aoi.AoiModel:
     """Create a test AoiModel based on GEE using Vatican.
 
     Args:
@@ -436,6 +475,19 @@ def test_model(gee_dir: Path) -> aoi.AoiModel:
     return aoi.AoiModel(admin=admin, folder=gee_dir)
 
 
+@pytest.fixture(scope="function")
+def test_model(_test_model: aoi.AoiModel) -> aoi.AoiModel:
+    """Hand a copy of the session model to each test.
+
+    Args:
+        _test_model: the session scoped model built on Vatican city
+
+    Returns:
+        an independent copy of the model object
+    """
+    return copy.deepcopy(_test_model)
+
+
 @pytest.fixture
 def aoi_model_traits() -> List[str]:
     """Return the list of an aoi model traits.
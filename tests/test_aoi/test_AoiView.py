@@ -30,12 +30,16 @@ def test_init() -> None:
     assert len(view.w_method.items) == 1 + 1  # 1 for the header, 1 for the object
 
     # init with a remove list
+    # ASSET and DRAW are also filtered out as there is no GEE nor map
     view = aoi.AoiView(["-POINTS"], gee=False)
     assert {"text": ms.aoi_sel.points, "value": "POINTS"} not in view.w_method.items
     assert (
-        len(view.w_method.items) == len(aoi.AoiModel.METHODS) + 2 - 1
+        len(view.w_method.items) == len(aoi.AoiModel.METHODS) + 2 - 3
     )  # 2 headers this time
 
+    # the module level METHODS dict must be left untouched by the views
+    assert all(k in aoi.AoiModel.METHODS for k in ["POINTS", "ASSET", "DRAW"])
+
     # init with a mix of both
     with pytest.raises(Exception):
         view = aoi.AoiView(["-POINTS", "DRAW"], gee=False)
@@ -29,45 +29,36 @@ def test_set_viz() -> None:
     return
 
 
-def test_show() -> None:
-    """Check show method can force show a widget."""
-    widget = sw.SepalWidget()
-
-    widget.viz = False
-    widget.show()
-    assert widget.viz is True
-    assert "d-none" not in str(widget.class_)
-
-    return
-
-
-def test_hide() -> None:
-    """Check hide can force hide a widget."""
-    widget = sw.SepalWidget()
-
-    widget.class_ = None
-    widget.hide()
-    assert widget.viz is False
-    assert "d-none" in str(widget.class_)
-
-    return
-
-
-def test_toggle_viz() -> None:
-    """Check visibility can be toggled."""
+@pytest.mark.parametrize(
+    ("initial_viz", "action", "expected_viz"),
+    [
+        (False, "show", True),
+        (True, "hide", False),
+        (True, "toggle_viz", False),
+        (False, "toggle_viz", True),
+    ],
+)
+def test_toggle_visibility(initial_viz: bool, action: str, expected_viz: bool) -> None:
+    """Check show/hide/toggle_viz can force the widget visibility.
+
+    Args:
+        initial_viz: the visibility of the widget before the action
+        action: the name of the method to call on the widget
+        expected_viz: the visibility of the widget after the action
+    """
     widget = sw.SepalWidget()
 
+    # start from a pristine class and the requested visibility
     widget.class_ = None
-    assert widget.viz is True
-    assert "d-none" not in str(widget.class_)
+    widget.viz = initial_viz
 
-    widget.toggle_viz()
-    assert widget.viz is False
-    assert "d-none" in str(widget.class_)
+    getattr(widget, action)()
 
-    widget.toggle_viz()
-    assert widget.viz is True
-    assert "d-none" not in str(widget.class_)
+    assert widget.viz is expected_viz
+    if expected_viz:
+        assert "d-none" not in str(widget.class_)
+    else:
+        assert "d-none" in str(widget.class_)
 
     return
 